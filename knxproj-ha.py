@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
+import sys
 import logging
 import argparse
-from knxproj_ha.convert import KNXHAConverter
 
 logger = logging.getLogger("convert")
 
@@ -11,12 +11,37 @@ def main():
     parser.add_argument("-d", "--debug", action="store_true")
     parser.add_argument("-c", "--comments", action="store_true")
     parser.add_argument("-i", "--input")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="classify group addresses in parallel using JOBS processes")
+    parser.add_argument("--validate", action="store_true", help="read the generated state addresses from the KNX bus and report unresponsive or wrongly-typed GAs")
+    parser.add_argument("--gateway-ip", help="KNX/IP tunnelling gateway used by --validate (default: automatic discovery)")
+    parser.add_argument("--gateway-port", type=int, default=3671)
+    parser.add_argument("--local-ip")
+    parser.add_argument("--rate-limit", type=int, default=20, help="maximum telegrams per second sent by --validate")
+    parser.add_argument("--concurrency", type=int, default=10, help="maximum reads waiting for a response at the same time, capped by --rate-limit and --read-timeout")
+    parser.add_argument("--read-timeout", type=float, default=2., help="seconds to wait for a GroupValueResponse")
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.validate:
+        try:
+            import xknx
+        except ImportError:
+            parser.error("--validate requires xknx, install with `poetry install -E validate`")
+    if args.rate_limit < 0:
+        parser.error("--rate-limit must not be negative")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.read_timeout <= 0:
+        parser.error("--read-timeout must be positive")
+
     if args.debug:
         logging.basicConfig(level=logging.DEBUG)
 
-    converter = KNXHAConverter(project_file_path=args.input)
+    # Imported after argument parsing, so that e.g. `--help` stays fast
+    from knxproj_ha.convert import KNXHAConverter
+
+    converter = KNXHAConverter(project_file_path=args.input, jobs=args.jobs)
     ha_config = converter.convert()
     converter.print(ha_config, comments=args.comments)
 
@@ -31,7 +56,29 @@ def main():
 
         logger.info("Unprocessed Group Addresses:\n" + '\n'.join(unprocessed_gas))
 
+    if args.validate:
+        from xknx.exceptions import CommunicationError
+        from knxproj_ha.validate import KNXBusValidator
+
+        if not args.debug:
+            # Unresponsive GAs are part of the validation report, don't log each timeout
+            logging.getLogger("xknx").setLevel(logging.ERROR)
+
+        validator = KNXBusValidator(converter.project, gateway_ip=args.gateway_ip, gateway_port=args.gateway_port,
+                                    local_ip=args.local_ip, rate_limit=args.rate_limit, timeout=args.read_timeout,
+                                    concurrency=args.concurrency)
+        try:
+            results = validator.run(ha_config)
+        except CommunicationError as err:
+            logger.error(f"Bus validation failed: {err}")
+            return 2
+
+        validator.print(results)
+        if results:
+            return 1
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
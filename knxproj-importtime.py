@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import sys
+import logging
+import argparse
+import subprocess
+
+logger = logging.getLogger("importtime")
+
+# Modules which must not be pulled in by merely importing the converter
+HEAVY_MODULES = ("ruamel", "yaml", "pydantic", "xknxproject", "xknx")
+
+
+def _measure(module):
+    """
+    Import `module` in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        dict: top-level imported package name -> cumulative import time in µs.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        (_, cumulative, name) = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="knxproj-importtime")
+    parser.add_argument("-d", "--debug", action="store_true")
+    parser.add_argument("-m", "--module", default="knxproj_ha.convert")
+    parser.add_argument("-b", "--budget", type=float, default=50., help="import time budget in ms")
+    parser.add_argument("-r", "--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+
+    runs = [_measure(args.module) for _ in range(args.runs)]
+    # The best run is the least disturbed by noise from other processes
+    best = min(runs, key=lambda timings: timings[args.module])
+    elapsed_ms = best[args.module] / 1000.
+
+    for name, cumulative in sorted(best.items(), key=lambda item: -item[1])[:10]:
+        logger.debug(f"\t{cumulative / 1000.:8.2f} ms {name}")
+
+    failed = False
+
+    heavy = sorted(name for name in best if name.split(".")[0] in HEAVY_MODULES)
+    if heavy:
+        logger.error(f"Importing {args.module} eagerly loads heavy modules: {', '.join(heavy)}")
+        failed = True
+
+    if elapsed_ms > args.budget:
+        logger.error(f"Importing {args.module} took {elapsed_ms:.2f} ms, exceeding the budget of {args.budget:.2f} ms")
+        failed = True
+    else:
+        logger.info(f"Importing {args.module} took {elapsed_ms:.2f} ms (budget {args.budget:.2f} ms)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
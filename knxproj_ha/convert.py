@@ -1,18 +1,9 @@
 import sys
 import logging
-from ruamel.yaml import YAML
-from ruamel.yaml.comments import CommentedMap, CommentedSeq
-from xknxproject import XKNXProj
-from .models import *
-import yaml
 
-class OrderedDumper(yaml.SafeDumper):
-    """A custom YAML dumper that respects the order of keys in OrderedDict."""
-
-def _dict_representer(dumper, data):
-    return dumper.represent_mapping(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, data.items())
-
-OrderedDumper.add_representer(dict, _dict_representer)
+# ruamel.yaml, xknxproject and the pydantic models are imported lazily on the
+# code paths that need them, this keeps importing this module (and thus the
+# CLI start-up) cheap.
 
 def _check_dpt(values, dpt_main, dpt_sub = None):
     if not (values and values['dpt']):
@@ -40,9 +31,10 @@ class KNXHAConverter:
 
     SENSOR_SUB_DPTS = (2, 4, 5, 6, 11, 12, 13, 14, 18)
 
-    def __init__(self, project_file_path, language='de-DE'):
+    def __init__(self, project_file_path, language='de-DE', jobs=1):
         self.project_file_path = project_file_path
         self.language = language
+        self.jobs = jobs
         self.processed_addresses = set()
         self.logger = logging.getLogger("knxproj_ha")
         self.project = None
@@ -119,6 +111,8 @@ class KNXHAConverter:
             tuple: (value_type, device_class, entity_class) or None if no match is found.
         """
 
+        from .models import Number, Sensor
+
         # Mapping of DPT main and sub to sensor types and device classes
         sensor_mappings = {
             # Format: (DPT main, DPT sub): ('value_type', 'device_class'),
@@ -317,6 +311,8 @@ class KNXHAConverter:
 
 
     def _get_lights_ga(self, group_addresses):
+        from .models import Light
+
         temp_lights = {}
         final_lights = {}
 
@@ -373,6 +369,8 @@ class KNXHAConverter:
 
 
     def _get_climate_ga(self, all_group_addresses):
+        from .models import Climate
+
         CURRENT_TEMPERATURE_GROUPNAME = "Ist-Temperaturen"
         TARGET_TEMPERATURE_GROUPNAME = "Soll-Temperaturen"
         TARGET_TEMPERATURE_STATE_GROUPNAME = None #"Basis-Solltemperaturen"
@@ -439,6 +437,8 @@ class KNXHAConverter:
 
 
     def _get_cover_ga(self, group_addresses):
+        from .models import Cover
+
         covers = {}
         # First, find group addresses with DPT 1.008
         for ga, values in group_addresses.items():
@@ -464,6 +464,8 @@ class KNXHAConverter:
 
 
     def _get_switches_ga(self, group_addresses):
+        from .models import Switch
+
         switches = []
 
         check_dpt_subs = lambda dpt_sub: dpt_sub not in self.SENSOR_SUB_DPTS
@@ -476,6 +478,8 @@ class KNXHAConverter:
 
 
     def _get_binary_sensors_ga(self, group_addresses):
+        from .models import BinarySensor
+
         binary_sensors = []
 
         check_dpt_subs = lambda dpt_sub: dpt_sub in self.SENSOR_SUB_DPTS
@@ -488,6 +492,8 @@ class KNXHAConverter:
 
 
     def _get_sensors_ga(self, group_addresses):
+        from .models import Number, Sensor
+
         sensors = []
 
         for ga, values in group_addresses.items():
@@ -505,18 +511,39 @@ class KNXHAConverter:
 
 
     def convert(self):
+        from xknxproject import XKNXProj
+
         knxproj: XKNXProj = XKNXProj(
             path=self.project_file_path,
             language="de-DE",  # optional
         )
         self.logger.debug("Start parsing KNX project file ...")
-        self.project = knxproj.parse()
+        project = knxproj.parse()
         self.logger.debug("... parsing finished")
 
+        return self.classify(project)
+
+
+    def classify(self, project):
+        """
+        Classify the group addresses of a parsed project into Home Assistant entities.
+
+        Args:
+            project (dict): project as returned by XKNXProj.parse().
+
+        Returns:
+            HAConfig: the extracted Home Assistant configuration.
+        """
+        from .models import HAConfig
+
+        self.project = project
         self.logger.debug(self.project["group_addresses"])
 
         self._find_listener_ga()
 
+        if self.jobs > 1:
+            return self._classify_parallel()
+
         self.numbers = []
 
         covers = self._get_cover_ga(self.project["group_addresses"])
@@ -529,7 +556,123 @@ class KNXHAConverter:
         return HAConfig(light=lights, switch=switches, binary_sensor=binary_sensors, sensor=sensors, climate=climate, cover=covers, number=self.numbers)
 
 
+    def _partition_group_addresses(self, count):
+        """
+        Split the project's group addresses into `count` partitions.
+
+        GAs are partitioned by their base name (the name without a bracketed suffix),
+        so all GAs which make up one multi-GA entity (cover, light) end up in the same
+        partition. Each partition keeps the project's GA order.
+
+        Returns:
+            list: list of non-empty group address dicts.
+        """
+        partitions = [{} for _ in range(count)]
+        base_name_partition = {}
+
+        for ga, values in self.project["group_addresses"].items():
+            base_name = values['name'].split(' (')[0]
+            index = base_name_partition.setdefault(base_name, len(base_name_partition) % count)
+            partitions[index][ga] = values
+
+        return [partition for partition in partitions if partition]
+
+
+    def _classify_partition(self, group_addresses, rank):
+        """
+        Classify one partition of group addresses, in the same claim order as `convert`.
+
+        Climate GAs have already been claimed (see `_classify_parallel`), their claims
+        are expected in `self.processed_addresses`.
+
+        Returns:
+            tuple: (dict of entity type -> list of (sort key, entity), set of claimed GAs).
+        """
+        climate_addresses = self.processed_addresses
+        self.numbers = []
+
+        # Covers and lights don't consult processed_addresses, so their claims are
+        # collected separately to find the GA which created each entity in serial mode
+        self.processed_addresses = set()
+        covers = self._get_cover_ga(group_addresses)
+        cover_addresses = self.processed_addresses
+
+        self.processed_addresses = set()
+        lights = self._get_lights_ga(group_addresses)
+        light_addresses = self.processed_addresses
+
+        self.processed_addresses = climate_addresses | cover_addresses | light_addresses
+        switches = self._get_switches_ga(group_addresses)
+        binary_sensors = self._get_binary_sensors_ga(group_addresses)
+        sensors = self._get_sensors_ga(group_addresses)
+
+        cover_keys = {}
+        light_keys = {}
+        for ga, values in group_addresses.items():
+            if _check_dpt(values, 1, 8):
+                cover_keys.setdefault(values['name'].split(' (')[0], rank[ga])
+            if ga in light_addresses:
+                light_keys.setdefault(values['name'], rank[ga])
+
+        entities = {
+            'cover': [(cover_keys[cover.name], cover) for cover in covers],
+            'light': [(light_keys[light.name], light) for light in lights],
+            'switch': [(rank[switch.address[0]], switch) for switch in switches],
+            'binary_sensor': [(rank[binary_sensor.state_address[0]], binary_sensor) for binary_sensor in binary_sensors],
+            'sensor': [(rank[sensor.state_address[0]], sensor) for sensor in sensors],
+            'number': [(rank[number.address[0]], number) for number in self.numbers],
+        }
+
+        return entities, self.processed_addresses
+
+
+    def _classify_parallel(self):
+        """
+        Classify the project's group addresses in a process pool of `self.jobs` workers.
+
+        Climate entities are collected from their group ranges only and depend on the
+        range order, so they are classified up front in this process. The remaining
+        classifiers run per partition against a read-only snapshot of the project
+        indexes, the results are merged back into the order serial mode produces.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from .models import HAConfig
+
+        group_addresses = self.project["group_addresses"]
+
+        self.processed_addresses = set()
+        climate = self._get_climate_ga(group_addresses)
+
+        snapshot = {
+            'group_ranges': self.project["group_ranges"],
+            'communication_objects': self.project["communication_objects"],
+        }
+        rank = {ga: index for index, ga in enumerate(group_addresses)}
+        partitions = self._partition_group_addresses(self.jobs * 4)
+
+        self.logger.debug(f"Classifying {len(group_addresses)} GAs in {len(partitions)} partitions using {self.jobs} processes ...")
+
+        merged = {}
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                 initargs=(snapshot, self.ga_listener_keys, self.processed_addresses, rank)) as executor:
+            for entities, claimed in executor.map(_classify_worker_partition, partitions):
+                for entity_type, keyed_entities in entities.items():
+                    merged.setdefault(entity_type, []).extend(keyed_entities)
+                self.processed_addresses |= claimed
+
+        self.logger.debug("... classification finished")
+
+        def ordered(entity_type):
+            return [entity for _, entity in sorted(merged.get(entity_type, []), key=lambda keyed: keyed[0])]
+
+        self.numbers = ordered('number')
+
+        return HAConfig(light=ordered('light'), switch=ordered('switch'), binary_sensor=ordered('binary_sensor'), sensor=ordered('sensor'), climate=climate, cover=ordered('cover'), number=self.numbers)
+
+
     def _serialize_groups(self, entity, comments=False):
+        from ruamel.yaml.comments import CommentedMap, CommentedSeq
+
         serialized_entity = CommentedMap()
         serialized_entity['name'] = entity.pop('name')
 
@@ -552,6 +695,10 @@ class KNXHAConverter:
 
 
     def print(self, ha_config, comments):
+        from pydantic import BaseModel
+        from ruamel.yaml import YAML
+        from ruamel.yaml.comments import CommentedMap
+
         ha_config_dict = ha_config.dict() if isinstance(ha_config, BaseModel) else ha_config
         filtered_config = CommentedMap({'knx': {}})
 
@@ -567,3 +714,20 @@ class KNXHAConverter:
         yaml_obj.dump(filtered_config, sys.stdout)
 
 
+# Per-process state of the parallel classification workers, see KNXHAConverter._classify_parallel
+_worker_converter = None
+_worker_processed_addresses = None
+_worker_rank = None
+
+def _init_worker(project, ga_listener_keys, processed_addresses, rank):
+    global _worker_converter, _worker_processed_addresses, _worker_rank
+
+    _worker_converter = KNXHAConverter(project_file_path=None)
+    _worker_converter.project = project
+    _worker_converter.ga_listener_keys = ga_listener_keys
+    _worker_processed_addresses = processed_addresses
+    _worker_rank = rank
+
+def _classify_worker_partition(group_addresses):
+    _worker_converter.processed_addresses = set(_worker_processed_addresses)
+    return _worker_converter._classify_partition(group_addresses, _worker_rank)
@@ -0,0 +1,154 @@
+import sys
+import asyncio
+import logging
+
+# xknx is imported lazily, it is only needed when validating against the bus.
+
+# Entity fields whose GAs are expected to answer GroupValueRead requests
+STATE_ADDRESS_FIELDS = ("state_address", "brightness_state_address", "temperature_address")
+
+
+class KNXBusValidator:
+    """
+    Validate the state addresses of a generated HAConfig against a live KNX bus.
+
+    Every GA referenced by one of the STATE_ADDRESS_FIELDS is read once via a
+    KNX/IP tunnel. GAs which don't respond, or respond with a payload which can't
+    be decoded with the DPT from the project, are reported per entity.
+    """
+
+    def __init__(self, project, gateway_ip=None, gateway_port=3671, local_ip=None,
+                 rate_limit=20, timeout=2., concurrency=10):
+        self.project = project
+        self.gateway_ip = gateway_ip
+        self.gateway_port = gateway_port
+        self.local_ip = local_ip
+        self.rate_limit = rate_limit
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.logger = logging.getLogger("knxproj_ha")
+
+
+    def _collect_state_addresses(self, ha_config):
+        """
+        Collect the GAs to validate from the given config.
+
+        Returns:
+            dict: (entity_type, entity name) -> list of (field, ga).
+        """
+        ha_config_dict = ha_config.dict() if not isinstance(ha_config, dict) else ha_config
+        entity_addresses = {}
+
+        for entity_type, entities in ha_config_dict.items():
+            for entity in entities:
+                for field in STATE_ADDRESS_FIELDS:
+                    for ga in entity.get(field) or []:
+                        entity_addresses.setdefault((entity_type, entity['name']), []).append((field, ga))
+
+        return entity_addresses
+
+
+    def _check_response(self, ga, telegram):
+        """
+        Check a GroupValueRead response against the DPT of the GA.
+
+        Returns:
+            str: description of the problem, or None if the GA responded as expected.
+        """
+        from xknx.dpt import DPTBase
+        from xknx.exceptions import ConversionError, CouldNotParseTelegram
+
+        if telegram is None:
+            return "no response"
+
+        dpt = self.project["group_addresses"].get(ga, {}).get('dpt')
+        transcoder = DPTBase.parse_transcoder(dpt) if dpt else None
+        if transcoder is None:
+            self.logger.debug(f"{ga}: no known DPT, skipping payload check")
+            return
+
+        payload = telegram.payload.value
+        try:
+            transcoder.from_knx(payload)
+        except (ConversionError, CouldNotParseTelegram):
+            return f"unexpected payload {payload} for DPT {dpt['main']}.{dpt['sub']}"
+
+
+    def _max_pending_reads(self):
+        """
+        Number of reads which may wait for a response at the same time.
+
+        The ValueReader timeout starts when a read is queued, not when xknx's rate
+        limiter actually sends it. So only queue as many reads as can be sent within
+        half of the timeout, otherwise responsive GAs time out while still queued.
+        """
+        if not self.rate_limit:
+            return self.concurrency
+        return min(self.concurrency, max(1, int(self.rate_limit * self.timeout) // 2))
+
+
+    async def _read(self, xknx, ga, semaphore):
+        from xknx.core import ValueReader
+        from xknx.telegram import GroupAddress
+
+        async with semaphore:
+            value_reader = ValueReader(xknx, GroupAddress(ga), timeout_in_seconds=self.timeout)
+            return await value_reader.read()
+
+
+    async def validate(self, ha_config):
+        """
+        Read all state addresses of `ha_config` from the bus.
+
+        Returns:
+            dict: (entity_type, entity name) -> list of (field, ga, problem), only
+            containing entities with at least one problem.
+        """
+        from xknx import XKNX
+        from xknx.io import ConnectionConfig, ConnectionType
+
+        entity_addresses = self._collect_state_addresses(ha_config)
+        # A GA may be shared between entities, read each one only once
+        gas = list(dict.fromkeys(ga for addresses in entity_addresses.values() for _, ga in addresses))
+
+        if self.gateway_ip:
+            connection_config = ConnectionConfig(connection_type=ConnectionType.TUNNELING, gateway_ip=self.gateway_ip,
+                                                 gateway_port=self.gateway_port, local_ip=self.local_ip)
+        else:
+            connection_config = ConnectionConfig(connection_type=ConnectionType.AUTOMATIC, local_ip=self.local_ip)
+
+        self.logger.debug(f"Reading {len(gas)} state addresses from the bus ...")
+
+        # xknx throttles outgoing telegrams to rate_limit per second, the semaphore
+        # bounds the number of reads waiting for a response at the same time
+        semaphore = asyncio.Semaphore(self._max_pending_reads())
+        async with XKNX(connection_config=connection_config, rate_limit=self.rate_limit) as xknx:
+            telegrams = await asyncio.gather(*(self._read(xknx, ga, semaphore) for ga in gas))
+
+        self.logger.debug("... reading finished")
+
+        problems = {ga: self._check_response(ga, telegram) for ga, telegram in zip(gas, telegrams)}
+
+        results = {}
+        for entity_key, addresses in entity_addresses.items():
+            for field, ga in addresses:
+                if problems[ga]:
+                    results.setdefault(entity_key, []).append((field, ga, problems[ga]))
+
+        return results
+
+
+    def run(self, ha_config):
+        return asyncio.run(self.validate(ha_config))
+
+
+    def print(self, results, file=None):
+        """Print the validation report, to stderr by default as stdout carries the generated YAML."""
+        file = file or sys.stderr
+
+        for (entity_type, name), problems in results.items():
+            file.write(f"{entity_type} '{name}' has invalid state addresses:\n")
+            for field, ga, problem in problems:
+                file.write(f"\t{field} {ga}: {problem}\n")
+
+        file.write(f"Bus validation finished, {len(results)} entities with invalid state addresses\n")
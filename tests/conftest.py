@@ -0,0 +1,112 @@
+import pytest
+
+
+# Communication object flags of a sending (write) and a status (read) object
+WRITE_FLAGS = {"read": False, "write": True, "transmit": False}
+READ_FLAGS = {"read": True, "write": False, "transmit": True}
+
+
+def _build_project():
+    """
+    Build a small project in the format returned by XKNXProj.parse().
+
+    It contains lights (one with a listener GA), climate, covers, switches, binary
+    sensors, sensors and a scene number. Entity GAs are interleaved across main
+    ranges, so merging the results of a parallel classification has to restore
+    the project order.
+    """
+    group_addresses = {}
+    communication_objects = {}
+    group_ranges = {}
+
+    def ga(address, name, dpt, flags=None, listeners=()):
+        co_ids = []
+        if flags:
+            co_id = f"CO-{len(communication_objects)}"
+            communication_objects[co_id] = {"flags": flags, "group_address_links": [address, *listeners]}
+            co_ids.append(co_id)
+        group_addresses[address] = {
+            "name": name,
+            "address": address,
+            "dpt": {"main": dpt[0], "sub": dpt[1]} if dpt else None,
+            "communication_object_ids": co_ids,
+        }
+        return address
+
+    def group_range(main, main_name, sub, sub_name, addresses):
+        main_range = group_ranges.setdefault(main, {"name": main_name, "group_addresses": [], "group_ranges": {}})
+        main_range["group_ranges"][sub] = {"name": sub_name, "group_addresses": list(addresses)}
+
+    group_range("0", "Zentral", "0/0", "Allgemein", [
+        ga("0/0/1", "Steckdose Terrasse", (1, 1)),
+        ga("0/0/2", "Präsenz Flur", (1, 11)),
+        ga("0/0/3", "Szene Wohnen", (17, 1)),
+        ga("0/0/4", "Leistung Küche", (14, 56)),
+        ga("0/0/5", "Unbekannt", None),
+    ])
+    group_range("1", "Beleuchtung", "1/0", "Schalten", [
+        ga("1/0/1", "Wohnzimmer Licht", (1, 1), WRITE_FLAGS, listeners=["1/0/9"]),
+        ga("1/0/2", "Küche Licht", (1, 1), WRITE_FLAGS),
+        ga("1/0/3", "Wohnzimmer Licht", (1, 1), READ_FLAGS),
+        ga("1/0/4", "Flur Licht", (1, 1), READ_FLAGS),  # no main address, dropped
+        ga("1/0/9", "Zentral Licht", (1, 1)),  # listener without CO, ends up as switch
+    ])
+    group_range("1", "Beleuchtung", "1/1", "Dimmen", [
+        ga("1/1/1", "Küche Licht", (5, 1), WRITE_FLAGS),
+        ga("1/1/2", "Wohnzimmer Licht", (5, 1), WRITE_FLAGS),
+        ga("1/1/3", "Küche Licht", (5, 1), READ_FLAGS),
+        ga("1/1/4", "Küche Licht", (7, 600), WRITE_FLAGS),
+    ])
+    group_range("2", "Jalousien", "2/0", "Fahren", [
+        ga("2/0/1", "Jalousie West (Position)", (5, 1)),
+        ga("2/0/2", "Jalousie Süd (Auf/Ab)", (1, 8)),
+        ga("2/0/3", "Jalousie West (Auf/Ab)", (1, 8)),
+        ga("2/0/4", "Jalousie Süd (Stop)", (1, 7)),
+        ga("2/0/5", "Jalousie West (Stop)", (1, 7)),
+    ])
+    group_range("3", "Heizung", "3/0", "Ist-Temperaturen", [
+        ga("3/0/1", "Büro", (9, 1)),
+        ga("3/0/2", "Bad", (9, 1)),
+        ga("3/0/3", "Keller", (9, 1)),
+    ])
+    group_range("3", "Heizung", "3/1", "Soll-Temperaturen", [
+        ga("3/1/1", "Bad", (9, 1)),
+        ga("3/1/2", "Büro", (9, 1)),
+    ])
+    group_range("3", "Heizung", "3/2", "Betriebsmodi", [
+        ga("3/2/1", "Bad", (20, 102)),
+    ])
+    group_range("3", "Heizung", "3/3", "Meldung Heizen", [
+        ga("3/3/1", "Büro", (1, 2)),
+    ])
+    group_range("3", "Heizung", "3/4", "Stellgrößen stetig", [
+        ga("3/4/1", "Bad", (5, 1)),
+    ])
+    group_range("4", "Sonstiges", "4/0", "Allgemein", [
+        ga("4/0/1", "Außentemperatur", (9, 1)),
+        ga("4/0/2", "Fenster Bad", (1, 19)),
+        ga("4/0/3", "Regen", (1, 5)),
+        ga("4/0/4", "Szene Schlafen", (17, 1)),
+    ])
+
+    return {
+        "group_addresses": group_addresses,
+        "group_ranges": group_ranges,
+        "communication_objects": communication_objects,
+    }
+
+
+@pytest.fixture
+def project():
+    return _build_project()
+
+
+@pytest.fixture
+def knxip_simulator():
+    pytest.importorskip("xknx")
+    from knxip_simulator import KNXIPTunnellingSimulator
+
+    simulator = KNXIPTunnellingSimulator()
+    simulator.start()
+    yield simulator
+    simulator.stop()
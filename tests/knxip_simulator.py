@@ -0,0 +1,98 @@
+import time
+import asyncio
+import threading
+
+from xknx.cemi import CEMIFrame, CEMILData, CEMIMessageCode
+from xknx.knxip import (HPAI, ConnectionStateResponse, ConnectResponse, DisconnectResponse, KNXIPFrame,
+                        KNXIPServiceType, TunnellingAck, TunnellingRequest)
+from xknx.knxip.connect_response import ConnectResponseData
+from xknx.telegram import IndividualAddress, Telegram
+from xknx.telegram.apci import GroupValueRead, GroupValueResponse
+
+
+class KNXIPTunnellingSimulator(asyncio.DatagramProtocol):
+    """
+    Minimal KNX/IP tunnelling server on localhost, answering GroupValueRead requests.
+
+    `values` maps GAs to the DPTBinary/DPTArray payload of the GroupValueResponse,
+    GAs which are not in `values` stay silent. The server runs its own event loop
+    in a background thread, so it can be used with blocking code like
+    `KNXBusValidator.run()`.
+    """
+
+    CHANNEL_ID = 1
+
+    def __init__(self, values=None):
+        self.values = values or {}
+        # (monotonic timestamp, GA) of every GroupValueRead received
+        self.read_requests = []
+        self.port = None
+        self.transport = None
+        self.sequence_counter = 0
+        self._loop = None
+        self._thread = None
+
+
+    def start(self):
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self.transport, _ = self._loop.run_until_complete(
+                self._loop.create_datagram_endpoint(lambda: self, local_addr=("127.0.0.1", 0)))
+            self.port = self.transport.get_extra_info("sockname")[1]
+            started.set()
+            self._loop.run_forever()
+            self.transport.close()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+    def _send(self, body, addr):
+        self.transport.sendto(KNXIPFrame.init_from_body(body).to_knx(), addr)
+
+
+    def _send_cemi(self, cemi, addr):
+        self._send(TunnellingRequest(self.CHANNEL_ID, self.sequence_counter, cemi.to_knx()), addr)
+        self.sequence_counter = (self.sequence_counter + 1) % 256
+
+
+    def datagram_received(self, data, addr):
+        frame, _ = KNXIPFrame.from_knx(data)
+        service_type = frame.header.service_type_ident
+
+        if service_type == KNXIPServiceType.CONNECT_REQUEST:
+            self.sequence_counter = 0
+            crd = ConnectResponseData(individual_address=IndividualAddress("1.1.250"))
+            self._send(ConnectResponse(communication_channel=self.CHANNEL_ID,
+                                       data_endpoint=HPAI("127.0.0.1", self.port), crd=crd), addr)
+        elif service_type == KNXIPServiceType.CONNECTIONSTATE_REQUEST:
+            self._send(ConnectionStateResponse(self.CHANNEL_ID), addr)
+        elif service_type == KNXIPServiceType.DISCONNECT_REQUEST:
+            self._send(DisconnectResponse(self.CHANNEL_ID), addr)
+        elif service_type == KNXIPServiceType.TUNNELLING_REQUEST:
+            self._send(TunnellingAck(self.CHANNEL_ID, frame.body.sequence_counter), addr)
+
+            # Confirm the request, as a real interface does once it was sent on the bus
+            cemi = CEMIFrame.from_knx(frame.body.raw_cemi)
+            cemi.code = CEMIMessageCode.L_DATA_CON
+            self._send_cemi(cemi, addr)
+
+            telegram = cemi.data.telegram()
+            if isinstance(telegram.payload, GroupValueRead):
+                ga = str(telegram.destination_address)
+                self.read_requests.append((time.monotonic(), ga))
+                if ga in self.values:
+                    response = Telegram(destination_address=telegram.destination_address,
+                                        source_address=IndividualAddress("1.1.1"),
+                                        payload=GroupValueResponse(self.values[ga]))
+                    self._send_cemi(CEMIFrame(code=CEMIMessageCode.L_DATA_IND,
+                                              data=CEMILData.init_from_telegram(response)), addr)
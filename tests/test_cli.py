@@ -0,0 +1,34 @@
+import sys
+import pathlib
+import subprocess
+
+import pytest
+
+ROOT = pathlib.Path(__file__).parent.parent
+SCRIPT = ROOT / "knxproj-ha.py"
+
+
+def _run(*args, prelude="pass"):
+    # Argument errors have to be reported before the project is parsed, so no input file is needed
+    code = f"import sys, runpy; {prelude}; sys.argv = {['knxproj-ha.py', *args]!r}; runpy.run_path({str(SCRIPT)!r}, run_name='__main__')"
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+
+
+def test_validate_without_xknx():
+    result = _run("--validate", prelude="sys.modules['xknx'] = None")
+
+    assert result.returncode == 2
+    assert "--validate requires xknx" in result.stderr
+
+
+@pytest.mark.parametrize("args, message", [
+    (("--jobs", "0"), "--jobs must be at least 1"),
+    (("--rate-limit", "-1"), "--rate-limit must not be negative"),
+    (("--concurrency", "0"), "--concurrency must be at least 1"),
+    (("--read-timeout", "0"), "--read-timeout must be positive"),
+])
+def test_invalid_arguments(args, message):
+    result = _run(*args)
+
+    assert result.returncode == 2
+    assert message in result.stderr
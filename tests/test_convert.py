@@ -0,0 +1,30 @@
+import pytest
+
+from knxproj_ha.convert import KNXHAConverter
+
+
+def test_classify(project):
+    converter = KNXHAConverter(project_file_path=None)
+    ha_config = converter.classify(project)
+
+    assert [light.name for light in ha_config.light] == ["Wohnzimmer Licht", "Küche Licht"]
+    assert ha_config.light[0].address == ["1/0/1", "1/0/9"]
+    assert [climate.name for climate in ha_config.climate] == ["Bad", "Büro"]
+    assert [cover.name for cover in ha_config.cover] == ["Jalousie Süd", "Jalousie West"]
+    assert ha_config.cover[1].position_address == ["2/0/1"]
+    assert [switch.address for switch in ha_config.switch] == [["0/0/1"], ["1/0/9"], ["4/0/2"]]
+    assert [binary_sensor.state_address for binary_sensor in ha_config.binary_sensor] == [["0/0/2"], ["4/0/3"]]
+    assert [sensor.state_address for sensor in ha_config.sensor] == [["0/0/4"], ["4/0/1"]]
+    assert [number.address for number in ha_config.number] == [["0/0/3"], ["4/0/4"]]
+
+
+@pytest.mark.parametrize("jobs", [2, 3, 8])
+def test_classify_parallel(project, jobs):
+    serial = KNXHAConverter(project_file_path=None)
+    serial_config = serial.classify(project)
+
+    parallel = KNXHAConverter(project_file_path=None, jobs=jobs)
+    parallel_config = parallel.classify(project)
+
+    assert parallel_config == serial_config
+    assert parallel.processed_addresses == serial.processed_addresses
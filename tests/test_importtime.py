@@ -0,0 +1,34 @@
+import sys
+import runpy
+import pathlib
+import subprocess
+
+import pytest
+
+ROOT = pathlib.Path(__file__).parent.parent
+SCRIPT = ROOT / "knxproj-importtime.py"
+
+importtime = runpy.run_path(str(SCRIPT))
+
+
+def test_no_heavy_modules():
+    timings = importtime["_measure"]("knxproj_ha.convert")
+
+    assert "knxproj_ha.convert" in timings
+    heavy = [name for name in timings if name.split(".")[0] in importtime["HEAVY_MODULES"]]
+    assert heavy == []
+
+
+def test_import_budget():
+    result = subprocess.run([sys.executable, str(SCRIPT)], cwd=ROOT, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("module", ["yaml", "pydantic"])
+def test_heavy_module_fails(module):
+    pytest.importorskip(module)
+    result = subprocess.run([sys.executable, str(SCRIPT), "-m", module, "-r", "1"], cwd=ROOT, capture_output=True, text=True)
+
+    assert result.returncode == 1
+    assert "eagerly loads heavy modules" in result.stderr
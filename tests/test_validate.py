@@ -0,0 +1,93 @@
+import io
+
+import pytest
+
+pytest.importorskip("xknx")
+
+from xknx.dpt import DPTArray, DPTBinary
+
+from knxproj_ha.models import BinarySensor, Climate, HAConfig, Light, Sensor
+from knxproj_ha.validate import KNXBusValidator
+
+
+PROJECT = {
+    "group_addresses": {
+        "1/0/1": {"name": "Wohnzimmer Licht Status", "dpt": {"main": 1, "sub": 1}},
+        "1/0/2": {"name": "Wohnzimmer Licht Helligkeit Status", "dpt": {"main": 5, "sub": 1}},
+        "2/0/1": {"name": "Bad Ist-Temperatur", "dpt": {"main": 9, "sub": 1}},
+        "2/0/2": {"name": "Bad Soll-Temperatur", "dpt": {"main": 9, "sub": 1}},
+        "3/0/1": {"name": "Außentemperatur", "dpt": {"main": 9, "sub": 1}},
+        "3/0/2": {"name": "Präsenz Flur", "dpt": {"main": 1, "sub": 11}},
+    },
+}
+
+HA_CONFIG = HAConfig(
+    light=[Light(name="Wohnzimmer Licht", address=["1/0/0"], state_address=["1/0/1"], brightness_state_address=["1/0/2"])],
+    climate=[Climate(name="Bad", temperature_address=["2/0/1"], target_temperature_state_address=["2/0/2"])],
+    sensor=[Sensor(name="Außentemperatur", state_address=["3/0/1"], type="temperature")],
+    binary_sensor=[BinarySensor(name="Präsenz Flur", state_address=["3/0/2"]),
+                   BinarySensor(name="Wohnzimmer Licht", state_address=["1/0/1"])],
+)
+
+
+def _validator(simulator, **kwargs):
+    return KNXBusValidator(PROJECT, gateway_ip="127.0.0.1", gateway_port=simulator.port, local_ip="127.0.0.1", **kwargs)
+
+
+def test_validate(knxip_simulator):
+    knxip_simulator.values = {
+        "1/0/1": DPTBinary(1),
+        # 1/0/2 stays silent
+        "2/0/1": DPTArray((0x0c, 0x1a)),
+        "3/0/1": DPTArray((0x01,)),  # DPT 9.001 is 2 bytes
+        "3/0/2": DPTBinary(0),
+    }
+
+    results = _validator(knxip_simulator, timeout=.5).run(HA_CONFIG)
+
+    assert results == {
+        ("light", "Wohnzimmer Licht"): [("brightness_state_address", "1/0/2", "no response")],
+        ("sensor", "Außentemperatur"): [("state_address", "3/0/1", 'unexpected payload <DPTArray value="[0x1]" /> for DPT 9.1')],
+    }
+    # GAs shared between entities are read only once, target temperatures aren't read at all
+    assert sorted(ga for _, ga in knxip_simulator.read_requests) == ["1/0/1", "1/0/2", "2/0/1", "3/0/1", "3/0/2"]
+
+
+def test_validate_slow_rate_limit(knxip_simulator):
+    knxip_simulator.values = {
+        "1/0/1": DPTBinary(1),
+        "1/0/2": DPTArray((0x80,)),
+        "2/0/1": DPTArray((0x0c, 0x1a)),
+        "3/0/1": DPTArray((0x0c, 0x1a)),
+        "3/0/2": DPTBinary(0),
+    }
+
+    # Queueing all reads at once would time out the last ones before they are sent
+    results = _validator(knxip_simulator, rate_limit=4, timeout=1., concurrency=10).run(HA_CONFIG)
+
+    assert results == {}
+    timestamps = [timestamp for timestamp, _ in knxip_simulator.read_requests]
+    assert all(later - earlier > .2 for earlier, later in zip(timestamps, timestamps[1:]))
+
+
+@pytest.mark.parametrize("rate_limit, timeout, expected", [
+    (0, 2., 10),
+    (20, 2., 10),
+    (4, 2., 4),
+    (2, 1., 1),
+    (1, .5, 1),
+])
+def test_max_pending_reads(rate_limit, timeout, expected):
+    validator = KNXBusValidator(PROJECT, rate_limit=rate_limit, timeout=timeout, concurrency=10)
+    assert validator._max_pending_reads() == expected
+
+
+def test_print():
+    output = io.StringIO()
+    KNXBusValidator(PROJECT).print({("light", "Wohnzimmer Licht"): [("brightness_state_address", "1/0/2", "no response")]}, file=output)
+
+    assert output.getvalue() == (
+        "light 'Wohnzimmer Licht' has invalid state addresses:\n"
+        "\tbrightness_state_address 1/0/2: no response\n"
+        "Bus validation finished, 1 entities with invalid state addresses\n"
+    )